@@ -4,16 +4,24 @@ A real-time fire detection monitoring system with temperature and gas level trac
 Provides a web dashboard and REST API for sensor data collection and visualization.
 """
 
-from fastapi import FastAPI, Request, HTTPException, Depends
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException, Depends
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import logging
 import time
+from typing import List
 
 from config import settings
-from models import SensorData, StatusResponse, HealthResponse
+from models import (
+    SensorData,
+    StatusResponse,
+    BatchStatusResponse,
+    DashboardStats,
+    HealthResponse,
+    sensor_logs_adapter
+)
 from storage import StorageInterface, storage
 from utils import setup_logging, get_current_timestamp
 
@@ -24,6 +32,14 @@ logger = logging.getLogger(__name__)
 # Track application start time for uptime calculation
 start_time = time.time()
 
+def render_dashboard() -> bytes:
+    """Render the static dashboard shell.
+    
+    Returns:
+        Encoded dashboard HTML
+    """
+    return templates.get_template("dashboard.html").render().encode("utf-8")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -40,6 +56,7 @@ app = FastAPI(
     version=settings.app_version,
     description="Real-time fire detection monitoring system with temperature and gas level tracking",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
@@ -56,6 +73,9 @@ app.add_middleware(
 # Initialize templates
 templates = Jinja2Templates(directory="templates")
 
+# Dashboard page, rendered once at import so it never depends on lifespan
+dashboard_html = render_dashboard()
+
 
 def get_storage() -> StorageInterface:
     """Dependency injection for storage.
@@ -66,7 +86,9 @@ def get_storage() -> StorageInterface:
     return storage
 
 
-@app.get("/health", response_model=HealthResponse, tags=["System"])
+# Response models below are declared via `responses=` for the OpenAPI schema
+# only; handlers return ORJSONResponse directly to skip output validation.
+@app.get("/health", responses={200: {"model": HealthResponse}}, tags=["System"])
 async def health_check():
     """Health check endpoint.
     
@@ -75,15 +97,15 @@ async def health_check():
     """
     uptime = time.time() - start_time
     
-    return HealthResponse(
-        status="healthy",
-        timestamp=get_current_timestamp(),
-        version=settings.app_version,
-        uptime_seconds=round(uptime, 2)
-    )
+    return ORJSONResponse(content={
+        "status": "healthy",
+        "timestamp": get_current_timestamp(),
+        "version": settings.app_version,
+        "uptime_seconds": round(uptime, 2)
+    })
 
 
-@app.post("/status", response_model=StatusResponse, tags=["Sensors"])
+@app.post("/status", responses={200: {"model": StatusResponse}}, tags=["Sensors"])
 async def update_status(
     data: SensorData,
     store: StorageInterface = Depends(get_storage)
@@ -109,16 +131,15 @@ async def update_status(
         store.add_log(data)
         
         logger.info(
-            f"Status updated: {data.status} | "
-            f"Temp: {data.temperature}°C | "
-            f"Gas: {data.gas} ppm"
+            "Status updated: %s | Temp: %s°C | Gas: %s ppm",
+            data.status, data.temperature, data.gas
         )
         
-        return StatusResponse(
-            message="Status updated successfully",
-            timestamp=get_current_timestamp(),
-            data=data
-        )
+        return ORJSONResponse(content={
+            "message": "Status updated successfully",
+            "timestamp": get_current_timestamp(),
+            "data": data.model_dump()
+        })
         
     except Exception as e:
         logger.error(f"Error updating status: {str(e)}")
@@ -128,60 +149,72 @@ async def update_status(
         )
 
 
-@app.get("/", response_class=HTMLResponse, tags=["Dashboard"])
-async def dashboard(
-    request: Request,
+@app.post("/status/batch", responses={200: {"model": BatchStatusResponse}}, tags=["Sensors"])
+async def update_status_batch(
+    batch: List[SensorData],
     store: StorageInterface = Depends(get_storage)
 ):
-    """Render the main dashboard.
+    """Store several buffered sensor readings in one request.
     
     Args:
-        request: FastAPI request object
+        batch: Sensor readings, oldest first
         store: Storage instance (injected)
         
     Returns:
-        Rendered HTML dashboard
+        Confirmation response with the number of received readings
+        
+    Raises:
+        HTTPException: If storing the readings fails
     """
     try:
-        # Get current status
-        current = store.get_current_status()
+        # Add timestamp to readings that do not carry one
+        timestamp = get_current_timestamp()
+        for data in batch:
+            if not data.timestamp:
+                data.timestamp = timestamp
         
-        # Default values if no data exists (use dict, not SensorData)
-        if current is None:
-            current_dict = {
-                "status": "normal",
-                "temperature": 0,
-                "gas": 0,
-                "timestamp": ""
-            }
-        else:
-            current_dict = current.model_dump()
+        store.add_logs(batch)
         
-        # Get statistics
-        stats = store.get_stats()
+        logger.info("Batch of %s status updates received", len(batch))
         
-        # Get recent logs (newest first for display)
-        recent_logs = store.get_recent_logs(limit=20)
-        # Convert SensorData objects to dicts for JSON serialization
-        logs_dict = [log.model_dump() for log in recent_logs]
-        
-        return templates.TemplateResponse("dashboard.html", {
-            "request": request,
-            "current": current_dict,
-            "logs": logs_dict,
-            "danger_count": stats["danger_count"],
-            "normal_count": stats["normal_count"]
+        return ORJSONResponse(content={
+            "message": "Batch stored successfully",
+            "timestamp": timestamp,
+            "received": len(batch)
         })
         
     except Exception as e:
-        logger.error(f"Error rendering dashboard: {str(e)}")
+        logger.error(f"Error storing status batch: {str(e)}")
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to render dashboard: {str(e)}"
+            detail=f"Failed to store status batch: {str(e)}"
         )
 
 
-@app.get("/api/stats", tags=["API"])
+@app.get("/", response_class=HTMLResponse, tags=["Dashboard"])
+async def dashboard():
+    """Serve the main dashboard.
+    
+    The page is a static shell rendered once at import; its script
+    fetches live data from /api/stats. In debug mode it is re-rendered
+    on every request so template edits show up without a restart.
+    
+    Returns:
+        Pre-rendered HTML dashboard
+    """
+    if settings.debug:
+        return HTMLResponse(
+            content=render_dashboard(),
+            headers={"Cache-Control": "no-cache"}
+        )
+    
+    return HTMLResponse(
+        content=dashboard_html,
+        headers={"Cache-Control": "public, max-age=60"}
+    )
+
+
+@app.get("/api/stats", responses={200: {"model": DashboardStats}}, tags=["API"])
 async def get_stats(store: StorageInterface = Depends(get_storage)):
     """Get current statistics.
     
@@ -189,16 +222,19 @@ async def get_stats(store: StorageInterface = Depends(get_storage)):
         store: Storage instance (injected)
         
     Returns:
-        Statistics including counts and current status
+        Statistics including counts, current status and the 20 most
+        recent logs (newest first)
     """
     stats = store.get_stats()
     current = store.get_current_status()
+    recent_logs = store.get_recent_logs(limit=20)
     
-    return {
+    return ORJSONResponse(content={
         **stats,
         "current_status": current.model_dump() if current else None,
+        "recent_logs": sensor_logs_adapter.dump_python(recent_logs),
         "timestamp": get_current_timestamp()
-    }
+    })
 
 
 @app.delete("/api/logs", tags=["API"])
@@ -214,10 +250,10 @@ async def clear_logs(store: StorageInterface = Depends(get_storage)):
     store.clear()
     logger.warning("All logs cleared via API")
     
-    return {
+    return ORJSONResponse(content={
         "message": "All logs cleared successfully",
         "timestamp": get_current_timestamp()
-    }
+    })
 
 
 if __name__ == "__main__":
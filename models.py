@@ -1,6 +1,6 @@
 """Data models for Fire Detection System."""
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 from typing import Literal, Optional
 from datetime import datetime
 
@@ -29,21 +29,46 @@ class SensorData(BaseModel):
         description="Timestamp of the reading (auto-generated if not provided)"
     )
     
+    # Range checks are enforced in pydantic-core by the Field ge/le
+    # constraints above; only the rounding needs a Python validator.
     @field_validator('temperature')
     @classmethod
     def validate_temperature(cls, v: float) -> float:
-        """Validate temperature is within reasonable range."""
-        if v < -50 or v > 150:
-            raise ValueError("Temperature must be between -50°C and 150°C")
+        """Round temperature to 2 decimal places."""
         return round(v, 2)
     
-    @field_validator('gas')
     @classmethod
-    def validate_gas(cls, v: int) -> int:
-        """Validate gas concentration is non-negative."""
-        if v < 0:
-            raise ValueError("Gas concentration cannot be negative")
-        return v
+    def fast_build(
+        cls,
+        status: Literal["danger", "normal"],
+        temperature: float,
+        gas: int,
+        timestamp: Optional[str] = None
+    ) -> "SensorData":
+        """Build a reading from trusted, already-valid values without validation.
+        
+        Only for internal callers such as trusted hardware pollers; anything
+        received over the API must go through ``SensorData(**payload)``.
+        
+        Args:
+            status: Fire detection status
+            temperature: Temperature in Celsius
+            gas: Gas concentration in ppm
+            timestamp: Optional reading timestamp
+            
+        Returns:
+            SensorData instance
+        """
+        # Mirror the validating constructor: float temperature rounded to
+        # 2 decimals, and timestamp only counted as set when provided
+        fields = {
+            "status": status,
+            "temperature": round(float(temperature), 2),
+            "gas": gas
+        }
+        if timestamp is not None:
+            fields["timestamp"] = timestamp
+        return cls.model_construct(**fields)
     
     model_config = {
         "json_schema_extra": {
@@ -63,6 +88,10 @@ class SensorData(BaseModel):
     }
 
 
+# Serializes a whole list of readings in one pydantic-core call
+sensor_logs_adapter = TypeAdapter(list[SensorData])
+
+
 class StatusResponse(BaseModel):
     """Response model for status updates."""
     
@@ -71,10 +100,21 @@ class StatusResponse(BaseModel):
     data: Optional[SensorData] = Field(None, description="Submitted sensor data")
 
 
+class BatchStatusResponse(BaseModel):
+    """Response model for batched status updates."""
+    
+    message: str = Field(..., description="Response message")
+    timestamp: str = Field(..., description="Server timestamp")
+    received: int = Field(
+        ge=0,
+        description="Number of readings received; storage keeps at most max_logs"
+    )
+
+
 class DashboardStats(BaseModel):
     """Dashboard statistics model."""
     
-    current_status: SensorData
+    current_status: Optional[SensorData] = Field(None, description="Most recent sensor reading")
     danger_count: int = Field(ge=0, description="Total danger alerts")
     normal_count: int = Field(ge=0, description="Total normal readings")
     total_logs: int = Field(ge=0, description="Total log entries")
@@ -82,6 +122,7 @@ class DashboardStats(BaseModel):
         default_factory=list,
         description="Recent sensor readings"
     )
+    timestamp: str = Field(..., description="Server timestamp")
 
 
 class HealthResponse(BaseModel):
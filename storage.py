@@ -1,7 +1,9 @@
 """Storage layer for Fire Detection System."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from collections import deque
+from itertools import islice
+from typing import Deque, Iterable, List, Optional
 from models import SensorData
 from config import settings
 import logging
@@ -17,6 +19,15 @@ class StorageInterface(ABC):
         """Add a new sensor log entry."""
         pass
     
+    def add_logs(self, batch: Iterable[SensorData]) -> None:
+        """Add several sensor log entries, oldest first.
+        
+        Default implementation adds entries one by one; backends can
+        override it with a batched write.
+        """
+        for data in batch:
+            self.add_log(data)
+    
     @abstractmethod
     def get_current_status(self) -> Optional[SensorData]:
         """Get the most recent sensor reading."""
@@ -44,7 +55,7 @@ class StorageInterface(ABC):
 
 
 class InMemoryStorage(StorageInterface):
-    """In-memory storage implementation using a list."""
+    """In-memory storage implementation using a bounded deque."""
     
     def __init__(self, max_logs: int = None):
         """Initialize in-memory storage.
@@ -52,8 +63,14 @@ class InMemoryStorage(StorageInterface):
         Args:
             max_logs: Maximum number of logs to keep. If None, uses settings.max_logs
         """
-        self.logs: List[SensorData] = []
         self.max_logs = max_logs or settings.max_logs
+        # Oldest entries are evicted automatically once max_logs is reached
+        self.logs: Deque[SensorData] = deque(maxlen=self.max_logs)
+        # Running counters so get_stats never has to scan the logs
+        self._danger = 0
+        self._normal = 0
+        # Most recent entry, kept for get_current_status
+        self._latest: Optional[SensorData] = None
         logger.info(f"Initialized in-memory storage with max_logs={self.max_logs}")
     
     def add_log(self, data: SensorData) -> None:
@@ -62,15 +79,53 @@ class InMemoryStorage(StorageInterface):
         Args:
             data: Sensor data to store
         """
+        # Account for the entry the deque is about to evict
+        if len(self.logs) == self.max_logs:
+            if self.logs[0].status == "danger":
+                self._danger -= 1
+            else:
+                self._normal -= 1
+        
+        if data.status == "danger":
+            self._danger += 1
+        else:
+            self._normal += 1
+        
         self.logs.append(data)
+        self._latest = data
+        
+        logger.debug("Added log entry: %s at %s", data.status, data.timestamp)
+    
+    def add_logs(self, batch: Iterable[SensorData]) -> None:
+        """Add several sensor log entries in one step.
         
-        # Trim logs if exceeding max_logs
-        if len(self.logs) > self.max_logs:
-            removed_count = len(self.logs) - self.max_logs
-            self.logs = self.logs[-self.max_logs:]
-            logger.debug(f"Trimmed {removed_count} old log entries")
+        Counter updates for evicted entries are done once for the whole
+        batch before a single deque.extend.
         
-        logger.debug(f"Added log entry: {data.status} at {data.timestamp}")
+        Args:
+            batch: Sensor data to store, oldest first
+        """
+        # Only the newest max_logs entries of the batch can be retained
+        kept = list(batch)[-self.max_logs:]
+        if not kept:
+            return
+        
+        # Account for the existing entries the deque is about to evict
+        overflow = len(self.logs) + len(kept) - self.max_logs
+        for old in islice(self.logs, max(overflow, 0)):
+            if old.status == "danger":
+                self._danger -= 1
+            else:
+                self._normal -= 1
+        
+        danger_count = sum(1 for data in kept if data.status == "danger")
+        self._danger += danger_count
+        self._normal += len(kept) - danger_count
+        
+        self.logs.extend(kept)
+        self._latest = kept[-1]
+        
+        logger.debug("Added %s log entries", len(kept))
     
     def get_current_status(self) -> Optional[SensorData]:
         """Get the most recent sensor reading.
@@ -78,9 +133,7 @@ class InMemoryStorage(StorageInterface):
         Returns:
             Most recent SensorData or None if no logs exist
         """
-        if not self.logs:
-            return None
-        return self.logs[-1]
+        return self._latest
     
     def get_recent_logs(self, limit: int = 20) -> List[SensorData]:
         """Get recent log entries.
@@ -91,7 +144,7 @@ class InMemoryStorage(StorageInterface):
         Returns:
             List of recent SensorData entries (newest first)
         """
-        return list(reversed(self.logs[-limit:]))
+        return list(islice(reversed(self.logs), limit))
     
     def get_all_logs(self) -> List[SensorData]:
         """Get all log entries.
@@ -99,7 +152,7 @@ class InMemoryStorage(StorageInterface):
         Returns:
             List of all SensorData entries
         """
-        return self.logs.copy()
+        return list(self.logs)
     
     def get_stats(self) -> dict:
         """Get statistics about stored data.
@@ -107,19 +160,19 @@ class InMemoryStorage(StorageInterface):
         Returns:
             Dictionary with danger_count, normal_count, and total_logs
         """
-        danger_count = sum(1 for log in self.logs if log.status == "danger")
-        normal_count = sum(1 for log in self.logs if log.status == "normal")
-        
         return {
-            "danger_count": danger_count,
-            "normal_count": normal_count,
-            "total_logs": len(self.logs)
+            "danger_count": self._danger,
+            "normal_count": self._normal,
+            "total_logs": self._danger + self._normal
         }
     
     def clear(self) -> None:
         """Clear all stored data."""
         count = len(self.logs)
         self.logs.clear()
+        self._danger = 0
+        self._normal = 0
+        self._latest = None
         logger.info(f"Cleared {count} log entries from storage")
 
 
@@ -17,14 +17,29 @@ def client():
         yield test_client
 
 
+@pytest.fixture(scope="module")
+def shared_storage():
+    """Create one storage instance per test module.
+    
+    Yields:
+        InMemoryStorage instance
+    """
+    shared = InMemoryStorage(max_logs=50)
+    yield shared
+    shared.clear()
+
+
 @pytest.fixture
-def storage():
-    """Create a fresh storage instance for testing.
+def storage(shared_storage: InMemoryStorage):
+    """Provide an empty storage instance for testing.
+    
+    Reuses the module's shared instance, cleared before each test.
     
     Returns:
         InMemoryStorage instance
     """
-    return InMemoryStorage(max_logs=50)
+    shared_storage.clear()
+    return shared_storage
 
 
 @pytest.fixture
@@ -1,7 +1,10 @@
 """Tests for API endpoints."""
 
+import re
 import pytest
 from fastapi.testclient import TestClient
+from main import app
+from storage import storage as app_storage
 
 
 def test_health_check(client: TestClient):
@@ -25,6 +28,40 @@ def test_dashboard_loads(client: TestClient):
     assert response.status_code == 200
     assert "Fire Detection" in response.text
     assert "dashboard" in response.text.lower()
+    assert response.headers["cache-control"] == "public, max-age=60"
+
+
+def test_dashboard_shell_has_no_initial_status(client: TestClient):
+    """Test that the cached shell does not claim a status before data arrives."""
+    response = client.get("/")
+    
+    assert response.status_code == 200
+    assert '<div id="statusDisplay" class="status-indicator status-unknown">' in response.text
+    assert '<div id="statusDisplay" class="status-indicator status-normal">' not in response.text
+    status_text = re.search(r'<div id="statusDisplay"[^>]*>(.*?)</div>', response.text, re.S).group(1)
+    assert status_text.strip() == "LOADING"
+    assert 'id="connectionAlert"' in response.text
+
+
+def test_dashboard_served_without_lifespan():
+    """Test that the dashboard is complete even if lifespan never ran."""
+    response = TestClient(app).get("/")
+    
+    assert response.status_code == 200
+    assert "Fire Detection" in response.text
+    assert 'id="statusDisplay"' in response.text
+
+
+def test_dashboard_rerenders_in_debug(client: TestClient, monkeypatch):
+    """Test that debug mode serves a freshly rendered, uncached dashboard."""
+    monkeypatch.setattr("main.settings.debug", True)
+    monkeypatch.setattr("main.dashboard_html", b"stale")
+    
+    response = client.get("/")
+    
+    assert response.status_code == 200
+    assert "Fire Detection" in response.text
+    assert response.headers["cache-control"] == "no-cache"
 
 
 def test_post_status_valid_data(client: TestClient, sample_sensor_data: dict):
@@ -101,6 +138,43 @@ def test_post_status_negative_gas(client: TestClient):
     assert response.status_code == 422  # Validation error
 
 
+def test_post_status_batch(client: TestClient, sample_sensor_data: dict, danger_sensor_data: dict):
+    """Test posting a batch of sensor readings."""
+    client.delete("/api/logs")
+    
+    response = client.post("/status/batch", json=[sample_sensor_data, danger_sensor_data])
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["received"] == 2
+    assert "timestamp" in data
+    
+    stats = client.get("/api/stats").json()
+    assert stats["normal_count"] == 1
+    assert stats["danger_count"] == 1
+    assert stats["current_status"]["status"] == "danger"
+    assert stats["current_status"]["timestamp"] == data["timestamp"]
+
+
+def test_post_status_batch_larger_than_max_logs(client: TestClient, sample_sensor_data: dict):
+    """Test that a batch over max_logs reports received vs retained readings."""
+    client.delete("/api/logs")
+    
+    response = client.post("/status/batch", json=[sample_sensor_data] * (app_storage.max_logs + 50))
+    
+    assert response.status_code == 200
+    assert response.json()["received"] == app_storage.max_logs + 50
+    assert client.get("/api/stats").json()["total_logs"] == app_storage.max_logs
+
+
+def test_post_status_batch_invalid_item(client: TestClient, sample_sensor_data: dict):
+    """Test that one invalid reading rejects the whole batch."""
+    invalid_data = {**sample_sensor_data, "gas": -100}
+    
+    response = client.post("/status/batch", json=[sample_sensor_data, invalid_data])
+    assert response.status_code == 422  # Validation error
+
+
 def test_get_stats(client: TestClient, sample_sensor_data: dict):
     """Test getting statistics."""
     # First post some data
@@ -119,6 +193,23 @@ def test_get_stats(client: TestClient, sample_sensor_data: dict):
     assert data["total_logs"] >= 1
 
 
+def test_get_stats_recent_logs(client: TestClient):
+    """Test that stats include recent logs newest first for the dashboard."""
+    client.delete("/api/logs")
+    for temperature in (21.0, 22.0, 23.0):
+        client.post("/status", json={
+            "status": "normal",
+            "temperature": temperature,
+            "gas": 3500
+        })
+    
+    response = client.get("/api/stats")
+    
+    assert response.status_code == 200
+    recent_logs = response.json()["recent_logs"]
+    assert [log["temperature"] for log in recent_logs] == [23.0, 22.0, 21.0]
+
+
 def test_clear_logs(client: TestClient, sample_sensor_data: dict):
     """Test clearing all logs."""
     # Post some data
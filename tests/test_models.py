@@ -2,7 +2,7 @@
 
 import pytest
 from pydantic import ValidationError
-from models import SensorData, StatusResponse, HealthResponse
+from models import SensorData, StatusResponse, HealthResponse, sensor_logs_adapter
 
 
 def test_sensor_data_valid():
@@ -31,14 +31,22 @@ def test_sensor_data_danger():
     assert data.gas == 5000
 
 
-def test_sensor_data_invalid_status():
-    """Test that invalid status raises validation error."""
-    with pytest.raises(ValidationError):
-        SensorData(
-            status="invalid",
-            temperature=25.0,
-            gas=3800
-        )
+@pytest.mark.parametrize("status,temperature,gas,valid", [
+    ("normal", 0, 0, True),           # minimum values
+    ("danger", 100, 10000, True),     # maximum values
+    ("invalid", 25.0, 3800, False),   # unknown status
+    ("danger", 200.0, 3800, False),   # beyond -50 to 150 range
+    ("normal", 25.0, -100, False),    # negative gas
+])
+def test_sensor_data_validation(status, temperature, gas, valid):
+    """Test sensor data boundary values and validation errors."""
+    if valid:
+        data = SensorData(status=status, temperature=temperature, gas=gas)
+        assert data.temperature == temperature
+        assert data.gas == gas
+    else:
+        with pytest.raises(ValidationError):
+            SensorData(status=status, temperature=temperature, gas=gas)
 
 
 def test_sensor_data_temperature_rounding():
@@ -52,26 +60,6 @@ def test_sensor_data_temperature_rounding():
     assert data.temperature == 25.56
 
 
-def test_sensor_data_extreme_temperature():
-    """Test that extreme temperatures are rejected."""
-    with pytest.raises(ValidationError):
-        SensorData(
-            status="danger",
-            temperature=200.0,  # Beyond -50 to 150 range
-            gas=3800
-        )
-
-
-def test_sensor_data_negative_gas():
-    """Test that negative gas values are rejected."""
-    with pytest.raises(ValidationError):
-        SensorData(
-            status="normal",
-            temperature=25.0,
-            gas=-100
-        )
-
-
 def test_sensor_data_with_timestamp():
     """Test sensor data with explicit timestamp."""
     timestamp = "2025-12-17 16:00:00"
@@ -96,6 +84,31 @@ def test_sensor_data_without_timestamp():
     assert data.timestamp is None
 
 
+def test_sensor_data_fast_build():
+    """Test that fast_build matches the validating constructor."""
+    validated = SensorData(
+        status="danger",
+        temperature=45.555555,
+        gas=4500,
+        timestamp="2025-12-17 16:00:00"
+    )
+    built = SensorData.fast_build("danger", 45.555555, 4500, "2025-12-17 16:00:00")
+    
+    assert built == validated
+    assert built.temperature == 45.56
+    assert built.model_fields_set == validated.model_fields_set
+    
+    # Int temperature and omitted timestamp behave like the validating path
+    validated = SensorData(status="normal", temperature=25, gas=3800)
+    built = SensorData.fast_build("normal", 25, 3800)
+    
+    assert built == validated
+    assert type(built.temperature) is type(validated.temperature) is float
+    assert built.timestamp is None
+    assert built.model_fields_set == validated.model_fields_set
+    assert built.model_dump(exclude_unset=True) == validated.model_dump(exclude_unset=True)
+
+
 def test_status_response():
     """Test status response model."""
     sensor_data = SensorData(
@@ -128,22 +141,11 @@ def test_health_response():
     assert response.uptime_seconds == 123.45
 
 
-def test_sensor_data_boundary_values():
-    """Test sensor data with boundary values."""
-    # Minimum values
-    data_min = SensorData(
-        status="normal",
-        temperature=0,
-        gas=0
-    )
-    assert data_min.temperature == 0
-    assert data_min.gas == 0
+def test_sensor_logs_adapter_dump():
+    """Test that the list adapter matches per-model model_dump output."""
+    logs = [
+        SensorData(status="normal", temperature=25.0, gas=3800),
+        SensorData(status="danger", temperature=50.0, gas=5000, timestamp="2025-12-17 16:00:00")
+    ]
     
-    # Maximum values
-    data_max = SensorData(
-        status="danger",
-        temperature=100,
-        gas=10000
-    )
-    assert data_max.temperature == 100
-    assert data_max.gas == 10000
+    assert sensor_logs_adapter.dump_python(logs) == [log.model_dump() for log in logs]
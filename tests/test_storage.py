@@ -1,7 +1,7 @@
 """Tests for storage layer."""
 
 import pytest
-from storage import InMemoryStorage
+from storage import InMemoryStorage, StorageInterface
 from models import SensorData
 
 
@@ -119,6 +119,7 @@ def test_clear(storage: InMemoryStorage):
     storage.clear()
     
     assert len(storage.logs) == 0
+    assert storage.get_current_status() is None
     stats = storage.get_stats()
     assert stats["total_logs"] == 0
 
@@ -150,3 +151,93 @@ def test_storage_copy_independence(storage: InMemoryStorage):
     
     # Original storage should still have the log
     assert len(storage.logs) == 1
+
+
+def test_get_stats_after_trim():
+    """Test that statistics only count logs retained after trimming."""
+    storage = InMemoryStorage(max_logs=3)
+    
+    # Two danger readings that will be evicted, then three normal ones
+    for _ in range(2):
+        storage.add_log(SensorData(status="danger", temperature=50.0, gas=5000))
+    for _ in range(3):
+        storage.add_log(SensorData(status="normal", temperature=25.0, gas=3800))
+    
+    stats = storage.get_stats()
+    
+    assert stats["danger_count"] == 0
+    assert stats["normal_count"] == 3
+    assert stats["total_logs"] == 3
+
+
+def test_add_logs(storage: InMemoryStorage):
+    """Test adding a batch of log entries."""
+    batch = [
+        SensorData(status="normal", temperature=25.0, gas=3800),
+        SensorData(status="danger", temperature=50.0, gas=5000),
+        SensorData(status="normal", temperature=26.0, gas=3900)
+    ]
+    
+    storage.add_logs(batch)
+    
+    assert list(storage.logs) == batch
+    assert storage.get_current_status() == batch[-1]
+    stats = storage.get_stats()
+    assert stats["normal_count"] == 2
+    assert stats["danger_count"] == 1
+    assert stats["total_logs"] == 3
+
+
+def test_add_logs_max_logs_limit():
+    """Test that batched adds evict old entries and keep counters in sync."""
+    storage = InMemoryStorage(max_logs=5)
+    for _ in range(3):
+        storage.add_log(SensorData(status="danger", temperature=50.0, gas=5000))
+    
+    # Batch larger than max_logs: only its newest 5 entries are retained
+    storage.add_logs(
+        SensorData(status="normal", temperature=20.0 + i, gas=3800)
+        for i in range(7)
+    )
+    
+    assert len(storage.logs) == 5
+    assert storage.logs[0].temperature == 22.0
+    assert storage.logs[4].temperature == 26.0
+    stats = storage.get_stats()
+    assert stats["danger_count"] == 0
+    assert stats["normal_count"] == 5
+    assert stats["total_logs"] == 5
+
+
+def test_add_logs_default_implementation():
+    """Test that backends without a batched override fall back to add_log."""
+    class ListStorage(StorageInterface):
+        def __init__(self):
+            self.logs = []
+        
+        def add_log(self, data):
+            self.logs.append(data)
+        
+        def get_current_status(self):
+            return self.logs[-1] if self.logs else None
+        
+        def get_recent_logs(self, limit=20):
+            return self.logs[::-1][:limit]
+        
+        def get_all_logs(self):
+            return list(self.logs)
+        
+        def get_stats(self):
+            return {}
+        
+        def clear(self):
+            self.logs.clear()
+    
+    batch = [
+        SensorData(status="normal", temperature=25.0, gas=3800),
+        SensorData(status="danger", temperature=50.0, gas=5000)
+    ]
+    storage = ListStorage()
+    storage.add_logs(iter(batch))
+    
+    assert storage.logs == batch
@@ -0,0 +1,68 @@
+"""Tests for utility functions."""
+
+import pytest
+import time
+from datetime import datetime
+from types import SimpleNamespace
+import utils
+from utils import (
+    get_current_timestamp,
+    format_temperature,
+    format_gas_level,
+    is_danger_condition
+)
+
+
+def test_get_current_timestamp_format():
+    """Test that the timestamp uses the standard format."""
+    timestamp = get_current_timestamp()
+    
+    parsed = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
+    assert abs((datetime.now() - parsed).total_seconds()) < 2
+
+
+def test_get_current_timestamp_reused_within_second(monkeypatch):
+    """Test that the formatted timestamp is cached per wall-clock second."""
+    now = [1765987200.25]
+    # Replace only utils' view of the time module, not time.time globally
+    monkeypatch.setattr(utils, "time", SimpleNamespace(
+        time=lambda: now[0],
+        strftime=time.strftime,
+        localtime=time.localtime
+    ))
+    monkeypatch.setattr(utils, "_timestamp_cache", (0, ""))
+    
+    first = get_current_timestamp()
+    
+    now[0] = 1765987200.75
+    assert get_current_timestamp() is first
+    
+    now[0] = 1765987201.0
+    assert get_current_timestamp() != first
+
+
+def test_format_temperature():
+    """Test temperature formatting with one decimal and unit."""
+    assert format_temperature(25.55) == "25.6°C"
+    assert format_temperature(-10) == "-10.0°C"
+
+
+def test_format_gas_level():
+    """Test gas level formatting with unit."""
+    assert format_gas_level(4500) == "4500 ppm"
+    assert format_gas_level(0) == "0 ppm"
+    # Same output as the original f"{gas} ppm" for non-int values
+    assert format_gas_level(4500.7) == "4500.7 ppm"
+    assert format_gas_level("4500") == "4500 ppm"
+
+
+@pytest.mark.parametrize("temperature,gas,expected", [
+    (25.0, 3800, False),
+    (40.0, 4000, False),
+    (40.5, 3800, True),
+    (25.0, 4001, True),
+    (50.0, 5000, True),
+])
+def test_is_danger_condition(temperature, gas, expected):
+    """Test danger detection against the temperature and gas thresholds."""
+    assert is_danger_condition(temperature, gas) is expected
@@ -2,26 +2,38 @@
 
 import logging
 import sys
-from datetime import datetime
+import time
 from config import settings
 
+# (epoch second, formatted timestamp) of the last get_current_timestamp call
+_timestamp_cache = (0, "")
+
+# Pre-bound %-format methods used by the formatting helpers
+_format_temperature = "%.1f°C".__mod__
+_format_gas_level = "%s ppm".__mod__
+
+# Example danger thresholds (can be made configurable)
+TEMP_THRESHOLD = 40.0  # °C
+GAS_THRESHOLD = 4000   # ppm
+
 
 def setup_logging() -> None:
     """Configure application logging."""
-    logging.basicConfig(
-        level=getattr(logging, settings.log_level.upper()),
-        format=settings.log_format,
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(settings.log_format))
+    
+    root = logging.getLogger()
+    root.setLevel(settings.log_level.upper())
+    # Replace (rather than add to) existing handlers so repeated calls
+    # do not duplicate output
+    root.handlers[:] = [stream_handler]
     
     # Set third-party loggers to WARNING to reduce noise
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
     
     logger = logging.getLogger(__name__)
-    logger.info(f"Logging configured at {settings.log_level} level")
+    logger.info("Logging configured at %s level", settings.log_level)
 
 
 def get_current_timestamp() -> str:
@@ -30,7 +42,15 @@ def get_current_timestamp() -> str:
     Returns:
         Formatted timestamp string (YYYY-MM-DD HH:MM:SS)
     """
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    global _timestamp_cache
+    
+    # The string only changes once per second, so reuse it until then
+    now = int(time.time())
+    cached_second, cached_timestamp = _timestamp_cache
+    if now != cached_second:
+        cached_timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        _timestamp_cache = (now, cached_timestamp)
+    return cached_timestamp
 
 
 def format_temperature(temp: float) -> str:
@@ -42,7 +62,7 @@ def format_temperature(temp: float) -> str:
     Returns:
         Formatted temperature string (e.g., "25.5°C")
     """
-    return f"{temp:.1f}°C"
+    return _format_temperature(temp)
 
 
 def format_gas_level(gas: int) -> str:
@@ -54,7 +74,7 @@ def format_gas_level(gas: int) -> str:
     Returns:
         Formatted gas level string (e.g., "4500 ppm")
     """
-    return f"{gas} ppm"
+    return _format_gas_level(gas)
 
 
 def is_danger_condition(temperature: float, gas: int) -> bool:
@@ -67,8 +87,4 @@ def is_danger_condition(temperature: float, gas: int) -> bool:
     Returns:
         True if conditions indicate danger, False otherwise
     """
-    # Example thresholds (can be made configurable)
-    TEMP_THRESHOLD = 40.0  # °C
-    GAS_THRESHOLD = 4000   # ppm
-    
     return temperature > TEMP_THRESHOLD or gas > GAS_THRESHOLD